@@ -17,6 +17,7 @@
 
 import shutil
 import time
+import threading
 import requests
 from gi.repository import GLib
 
@@ -26,6 +27,16 @@ from bottles.backend.models.result import Result
 
 logging = Logger()
 
+# one session per thread, to keep connections (and TLS sessions) alive
+# across downloads; requests doesn't guarantee a Session is thread-safe
+_sessions = threading.local()
+
+
+def _get_session() -> requests.Session:
+    if not hasattr(_sessions, "session"):
+        _sessions.session = requests.Session()
+    return _sessions.session
+
 
 class Downloader:
     """
@@ -47,32 +58,35 @@ class Downloader:
             with open(self.file, "wb") as file:
                 self.start_time = time.time()
                 headers = {"User-Agent": "curl/7.79.1"}  # we fake the user-agent to avoid 403 errors on some servers
-                response = requests.get(self.url, stream=True, headers=headers)
+                response = _get_session().get(self.url, stream=True, headers=headers)
                 total_size = int(response.headers.get("content-length", 0))
-                block_size = 1024
-                count = 0
+                # large chunks keep write syscalls and progress updates low
+                block_size = 64 * 1024
+                done = 0
 
                 if total_size != 0:
                     for data in response.iter_content(block_size):
                         file.write(data)
-                        count += 1
+                        # progress is reported in bytes (count=done, block_size=1)
+                        # and capped, as the last chunk is usually partial
+                        done = min(done + len(data), total_size)
                         if self.func is not None:
                             if self.task_id:
                                 GLib.idle_add(
                                     self.func,
                                     self.task_id,
-                                    count,
-                                    block_size,
+                                    done,
+                                    1,
                                     total_size
                                 )
                             else:
                                 GLib.idle_add(
                                     self.func,
-                                    count,
-                                    block_size,
+                                    done,
+                                    1,
                                     total_size
                                 )
-                            self.__progress(count, block_size, total_size)
+                            self.__progress(done, 1, total_size)
                 else:
                     file.write(response.content)
                     if self.func is not None:
@@ -89,10 +103,11 @@ class Downloader:
 
     def __progress(self, count, block_size, total_size):
         """Update the progress bar."""
-        percent = int(count * block_size * 100 / total_size)
-        done_str = FileUtils.get_human_size(count * block_size)
+        done = min(count * block_size, total_size)
+        percent = int(done * 100 / total_size)
+        done_str = FileUtils.get_human_size(done)
         total_str = FileUtils.get_human_size(total_size)
-        speed_str = FileUtils.get_human_size(count * block_size / (time.time() - self.start_time))
+        speed_str = FileUtils.get_human_size(done / (time.time() - self.start_time))
         name = self.file.split("/")[-1]
         c_close, c_complete, c_incomplete = "\033[0m", "\033[92m", "\033[90m"
         divider = 2
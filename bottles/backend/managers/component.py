@@ -33,6 +33,7 @@ except (RuntimeError, GLib.GError):
     from bottles.frontend.cli.operation_cli import OperationManager
 
 from bottles.backend.utils.generic import is_glibc_min_available
+from bottles.backend.utils.curl import new_curl
 from bottles.backend.utils.manager import ManagerUtils
 from bottles.backend.utils.file import FileUtils
 from bottles.backend.globals import Paths
@@ -174,10 +175,24 @@ class ComponentManager:
             GLib.idle_add(_update_func, task_id, count, block_size, total_size, completed)
 
         existing_file = rename if rename else file
+        existing_path = os.path.join(Paths.temp, existing_file)
         temp_dest = os.path.join(Paths.temp, file)
         just_downloaded = False
 
-        if os.path.isfile(os.path.join(Paths.temp, existing_file)):
+        if checksum and os.path.isfile(existing_path):
+            '''
+            Verify the file already in the /temp directory, if any. A
+            mismatch (e.g. an interrupted download) is discarded and the
+            file is downloaded again, instead of failing.
+            '''
+            checksum = checksum.lower()
+            if FileUtils().get_checksum(existing_path) == checksum:
+                checksum = ""  # already verified, skip the check below
+            else:
+                logging.warning(f"File [{existing_file}] in temp does not match its checksum, downloading again.")
+                os.remove(existing_path)
+
+        if os.path.isfile(existing_path):
             '''
             Check if the file already exists in the /temp directory.
             If so, then skip the download process and set the update_func
@@ -192,9 +207,7 @@ class ComponentManager:
             skipped for large files (e.g. runners).
             '''
             try:
-                c = pycurl.Curl()
-                c.setopt(c.URL, download_url)
-                c.setopt(c.FOLLOWLOCATION, True)
+                c = new_curl(download_url)
                 c.setopt(c.HTTPHEADER, ["User-Agent: curl/7.79.1"])
                 c.setopt(c.NOBODY, True)
                 c.perform()
@@ -264,6 +277,44 @@ class ComponentManager:
         GLib.idle_add(self.__operation_manager.remove_task, task_id)
         return True
 
+    @staticmethod
+    def group_downloads(steps: dict) -> dict:
+        """
+        Group download steps, given by id, that can be downloaded
+        concurrently. download() writes to temp/<file_name> and then
+        renames it to temp/<rename>, so a step can only share the download
+        of an earlier step with the same file_name and rename, and can't
+        run alongside any other download touching one of those files.
+        Return, for each step that can be downloaded ahead, the id of the
+        step performing its download. Colliding steps are left out and
+        have to be downloaded when they run.
+        """
+        def key(step):
+            return step.get("file_name"), step.get("rename") or None
+
+        owners = {}
+        groups = {}
+
+        for step_id, step in steps.items():
+            targets = {t for t in key(step) if t}
+            claimed = {owners[t] for t in targets if t in owners}
+
+            if not claimed:
+                owners.update(dict.fromkeys(targets, step_id))
+                groups[step_id] = step_id
+                continue
+
+            owner = claimed.pop()
+            if not claimed and owner is not None and key(steps[owner]) == key(step):
+                groups[step_id] = owner
+                continue
+
+            # collides with another download, later steps touching
+            # these files have to wait for it too
+            owners.update(dict.fromkeys(targets, None))
+
+        return groups
+
     @staticmethod
     def extract(name: str, component: str, archive: str) -> True:
         """Extract a component from an archive."""
@@ -19,6 +19,7 @@ import os
 import uuid
 import shutil
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from glob import glob
 from functools import lru_cache
 from typing import Union
@@ -82,6 +83,71 @@ class DependencyManager:
         catalog = dict(sorted(catalog.items()))
         return catalog
 
+    def prefetch(self, config: BottleConfig, dependencies: list):
+        """
+        Fetch the manifests of the given dependencies (and of the ones
+        they depend on) and download all the files they need concurrently.
+        The installation itself is still performed by install(), one
+        dependency at a time as they all share the same wineprefix, but
+        it will find the files already in the temp directory. Files
+        colliding with another download (see group_downloads) are left
+        to install().
+        """
+        supported = self.__manager.supported_dependencies
+        installed = config.Installed_Dependencies or []
+        component_manager = self.__manager.component_manager
+        seen = set()
+        steps = []
+        downloads = {}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            queue = list(dependencies)
+            pending = set()
+
+            while queue or pending:
+                for name in queue:
+                    if name in seen or name in installed or name not in supported:
+                        continue
+                    seen.add(name)
+                    pending.add(executor.submit(self.get_dependency, name))
+                queue = []
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    manifest = None if future.exception() else future.result()
+                    if not manifest:
+                        continue
+
+                    queue += manifest.get("Dependencies", [])
+                    for step in manifest.get("Steps", []):
+                        if self.__needs_download(config, step):
+                            steps.append(step)
+
+            groups = component_manager.group_downloads(dict(enumerate(steps)))
+            for owner in set(groups.values()):
+                step = steps[owner]
+                downloads[step.get("file_name")] = executor.submit(
+                    component_manager.download,
+                    download_url=step.get("url"),
+                    file=step.get("file_name"),
+                    rename=step.get("rename"),
+                    checksum=step.get("file_checksum")
+                )
+
+        for file, future in downloads.items():
+            if future.exception() or not future.result():
+                logging.warning(f"Prefetching [{file}] failed, it will be downloaded again during installation.")
+
+    @staticmethod
+    def __needs_download(config: BottleConfig, step: dict) -> bool:
+        if step.get("action") not in [
+            "download_archive", "install_exe", "install_msi", "cab_extract", "archive_extract"
+        ]:
+            return False
+        if config.Arch not in step.get("for", "win64_win32"):
+            return False
+        return validate_url(step.get("url", ""))
+
     def install(
             self,
             config: BottleConfig,
@@ -110,10 +176,7 @@ class DependencyManager:
             self.__operation_manager.new_task, task_id, dependency[0], False
         )
 
-        logging.info("Installing dependency [%s] in bottle [%s]." % (
-            dependency[0],
-            config.Name
-        ), )
+        logging.info(f"Installing dependency [{dependency[0]}] in bottle [{config.Name}].")
         manifest = self.get_dependency(dependency[0])
         if not manifest:
             """
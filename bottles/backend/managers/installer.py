@@ -18,6 +18,7 @@ import dataclasses
 import os
 import subprocess
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import markdown
 import pycurl
@@ -34,10 +35,12 @@ except (RuntimeError, GLib.GError):
     from bottles.frontend.cli.operation_cli import OperationManager
     from bottles.frontend.windows.generic_cli import MessageDialog
 
+from bottles.backend.managers.component import ComponentManager
 from bottles.backend.managers.conf import ConfigManager
 from bottles.backend.globals import Paths
 from bottles.backend.logger import Logger
 
+from bottles.backend.utils.curl import new_curl
 from bottles.backend.utils.manager import ManagerUtils
 from bottles.backend.utils.wine import WineUtils
 
@@ -46,6 +49,8 @@ from bottles.backend.wine.winecommand import WineCommand
 
 from bottles.backend.models.result import Result
 
+from bottles.frontend.utils.threading import RunAsync
+
 logging = Logger()
 
 
@@ -76,7 +81,10 @@ class InstallerManager:
     ) -> Union[str, dict, bool]:
         """
         Return an installer manifest from the repository. Use the plain
-        argument to get the manifest as plain text.
+        argument to get the manifest as plain text. Both views come from
+        the same repository cache entry, so asking for the other one
+        only costs a conditional request, without downloading or
+        parsing the manifest again.
         """
         return self.__repo.get(installer_name, plain)
 
@@ -98,24 +106,32 @@ class InstallerManager:
         """Wrapper for the repo method."""
         return self.__repo.get_icon(installer)
 
-    def __download_icon(self, config, executable: dict, manifest):
+    def __download_icon(self, bottle_icons_path: str, executable: dict, manifest):
         """
         Download the installer icon from the repository to the bottle
         icons path.
         """
         icon_url = self.__repo.get_icon(manifest.get("Name"))
-        bottle_icons_path = f"{ManagerUtils.get_bottle_path(config)}/icons"
         icon_path = f"{bottle_icons_path}/{executable.get('icon')}"
 
         if icon_url is not None:
-            if not os.path.exists(bottle_icons_path):
-                os.makedirs(bottle_icons_path)
-
-            if not os.path.isfile(icon_path):
-                c = pycurl.Curl()
-                c.setopt(c.URL, icon_url)
-                c.setopt(c.WRITEDATA, open(icon_path, "wb"))
-                c.perform()
+            os.makedirs(bottle_icons_path, exist_ok=True)
+
+            # create the file only if missing, checking and creating at once
+            try:
+                fd = os.open(icon_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                return
+
+            c = new_curl(icon_url)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    c.setopt(c.WRITEDATA, f)
+                    c.perform()
+            except pycurl.error:
+                logging.error(f"Cannot download icon for {manifest.get('Name')}.")
+                os.remove(icon_path)
+            finally:
                 c.close()
 
     def __process_local_resources(self, exe_msi_steps, installer):
@@ -137,16 +153,21 @@ class InstallerManager:
     ):
         """Install a list of dependencies"""
         _config = config
+        supported = self.__manager.supported_dependencies
+        dependency_manager = self.__manager.dependency_manager
+        dependency_manager.prefetch(_config, dependencies)
 
         for dep in dependencies:
             if is_final:
                 step_fn()
 
+            # not hoisted: each install replaces the list, and can also
+            # install the following entries as nested dependencies
             if dep in config.Installed_Dependencies:
                 continue
 
-            _dep = [dep, self.__manager.supported_dependencies.get(dep)]
-            res = self.__manager.dependency_manager.install(_config, _dep)
+            _dep = [dep, supported.get(dep)]
+            res = dependency_manager.install(_config, _dep)
 
             if not res.status:
                 return False
@@ -171,54 +192,89 @@ class InstallerManager:
 
         return True
 
+    def __download_step(self, st: dict) -> bool:
+        return self.__component_manager.download(
+            st.get("url"),
+            st.get("file_name"),
+            st.get("rename"),
+            checksum=st.get("file_checksum")
+        )
+
+    def __prefetch_steps(self, pool: ThreadPoolExecutor, steps: list) -> dict:
+        """
+        Start downloading the files of all the install_exe/install_msi
+        steps, returning the download future of each step by its index.
+        Steps colliding with another download (see group_downloads) are
+        left out and downloaded when they run.
+        """
+        downloads = {}
+        groups = ComponentManager.group_downloads({
+            i: st for i, st in enumerate(steps)
+            if st.get("action") in ["install_exe", "install_msi"] and st.get("url") != "local"
+        })
+
+        for i, owner in groups.items():
+            if owner not in downloads:
+                downloads[owner] = pool.submit(self.__download_step, steps[owner])
+            downloads[i] = downloads[owner]
+
+        return downloads
+
     def __perform_steps(self, config: BottleConfig, steps: list):
-        """Perform a list of actions"""
-        for st in steps:
-            # Step type: run_script
-            if st.get("action") == "run_script":
-                self.__step_run_script(config, st)
-
-            # Step type: run_winecommand
-            if st.get("action") == "run_winecommand":
-                self.__step_run_winecommand(config, st)
-
-            # Step type: update_config
-            if st.get("action") == "update_config":
-                self.__step_update_config(config, st)
-
-            # Step type: install_exe, install_msi
-            if st["action"] in ["install_exe", "install_msi"]:
-                if st["url"] != "local":
-                    download = self.__component_manager.download(
-                        st.get("url"),
-                        st.get("file_name"),
-                        st.get("rename"),
-                        checksum=st.get("file_checksum")
-                    )
-                else:
-                    download = True
-
-                if download:
-                    if st["url"] != "local":
-                        if st.get("rename"):
-                            file = st.get("rename")
+        """
+        Perform a list of actions. Files are downloaded in the background
+        while the steps are executed, in order, as soon as they are ready.
+        """
+        pool = ThreadPoolExecutor(max_workers=4)
+        try:
+            downloads = self.__prefetch_steps(pool, steps)
+
+            for i, st in enumerate(steps):
+                # Step type: run_script
+                if st.get("action") == "run_script":
+                    self.__step_run_script(config, st)
+
+                # Step type: run_winecommand
+                if st.get("action") == "run_winecommand":
+                    self.__step_run_winecommand(config, st)
+
+                # Step type: update_config
+                if st.get("action") == "update_config":
+                    self.__step_update_config(config, st)
+
+                # Step type: install_exe, install_msi
+                if st["action"] in ["install_exe", "install_msi"]:
+                    if st["url"] == "local":
+                        download = True
+                    elif i in downloads:
+                        download = downloads[i].result()
+                    else:
+                        download = self.__download_step(st)
+
+                    if download:
+                        if st["url"] != "local":
+                            if st.get("rename"):
+                                file = st.get("rename")
+                            else:
+                                file = st.get("file_name")
+                            file_path = f"{Paths.temp}/{file}"
                         else:
-                            file = st.get("file_name")
-                        file_path = f"{Paths.temp}/{file}"
+                            file_path = self.__local_resources[st.get("file_name")]
+
+                        executor = WineExecutor(
+                            config,
+                            exec_path=file_path,
+                            args=st.get("arguments"),
+                            environment=st.get("environment"),
+                            monitoring=st.get("monitoring", []),
+                        )
+                        executor.run()
                     else:
-                        file_path = self.__local_resources[st.get("file_name")]
-
-                    executor = WineExecutor(
-                        config,
-                        exec_path=file_path,
-                        args=st.get("arguments"),
-                        environment=st.get("environment"),
-                        monitoring=st.get("monitoring", []),
-                    )
-                    executor.run()
-                else:
-                    logging.error(f"Failed to download {st.get('file_name')}, or checksum failed.")
-                    return False
+                        logging.error(f"Failed to download {st.get('file_name')}, or checksum failed.")
+                        return False
+        finally:
+            # don't start queued downloads once the steps stopped
+            pool.shutdown(cancel_futures=True)
         return True
 
     @staticmethod
@@ -240,9 +296,10 @@ class InstallerManager:
 
     @staticmethod
     def __step_run_script(config: BottleConfig, step: dict):
+        bottle_path = ManagerUtils.get_bottle_path(config)
         placeholders = {
-            "!bottle_path": ManagerUtils.get_bottle_path(config),
-            "!bottle_drive": f"{ManagerUtils.get_bottle_path(config)}/drive_c",
+            "!bottle_path": bottle_path,
+            "!bottle_drive": f"{bottle_path}/drive_c",
             "!bottle_name": config.Name,
             "!bottle_arch": config.Arch
         }
@@ -263,7 +320,7 @@ class InstallerManager:
         subprocess.Popen(
             f"bash -c '{script}'",
             shell=True,
-            cwd=ManagerUtils.get_bottle_path(config),
+            cwd=bottle_path,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         ).communicate()
@@ -312,17 +369,17 @@ class InstallerManager:
         if "sync" in new_params and config.Parameters.sync != "wine":
             del new_params["sync"]
 
-        for k, v in new_params.items():
-            self.__manager.update_config(
-                config=config,
-                key=k,
-                value=v,
-                scope="Parameters"
-            )
+        self.__manager.update_config_bulk(
+            config=config,
+            updates=new_params,
+            scope="Parameters"
+        )
 
     def count_steps(self, installer) -> dict:
         manifest = self.get_installer(installer[0])
         steps = {"total": 0, "sections": []}
+        if not manifest:
+            return steps
         if manifest.get("Dependencies"):
             i = int(len(manifest.get("Dependencies")))
             steps["sections"] += i * ["deps"]
@@ -345,6 +402,8 @@ class InstallerManager:
 
     def has_local_resources(self, installer):
         manifest = self.get_installer(installer[0])
+        if not manifest:
+            return []
         steps = manifest.get("Steps", [])
         exe_msi_steps = [s for s in steps
                          if s.get("action", "") in ["install_exe", "install_msi"]
@@ -359,9 +418,14 @@ class InstallerManager:
     def install(self, config: BottleConfig, installer: dict, step_fn: callable, is_final: bool = True,
                 local_resources: dict = None):
         manifest = self.get_installer(installer[0])
+        if not manifest:
+            logging.error(f"Cannot fetch the manifest for {installer[0]}, aborting.")
+            return Result(False, data={"message": "Cannot fetch the installer manifest."})
+
         _config = config
 
         bottle = ManagerUtils.get_bottle_path(config)
+        bottle_icons_path = os.path.join(bottle, "icons")
         installers = manifest.get("Installers")
         dependencies = manifest.get("Dependencies")
         parameters = manifest.get("Parameters")
@@ -369,15 +433,21 @@ class InstallerManager:
         steps = manifest.get("Steps")
         checks = manifest.get("Checks")
 
-        # download icon
+        # download icon, in background while the installation goes on
+        icon_task = None
         if executable.get("icon"):
-            self.__download_icon(_config, executable, manifest)
+            icon_task = RunAsync(
+                self.__download_icon,
+                bottle_icons_path=bottle_icons_path,
+                executable=executable,
+                manifest=manifest
+            )
 
         # install dependent installers
         if installers:
             logging.info("Installing dependent installers")
             for i in installers:
-                if not self.install(config, i, step_fn, False):
+                if not self.install(config, i, step_fn, False).status:
                     logging.error("Failed to install dependent installer(s)")
                     return Result(False, data={"message": "Failed to install dependent installer(s)"})
 
@@ -460,8 +530,9 @@ class InstallerManager:
             )
 
         # create Desktop entry
-        bottles_icons_path = os.path.join(ManagerUtils.get_bottle_path(config), "icons")
-        icon_path = os.path.join(bottles_icons_path, executable.get('icon'))
+        if icon_task:
+            icon_task.join()
+        icon_path = os.path.join(bottle_icons_path, executable.get('icon'))
         ManagerUtils.create_desktop_entry(_config, _program, False, icon_path)
 
         if is_final:
@@ -874,15 +874,33 @@ class Manager:
         is set to True.
         TODO: move to bottle.py (Bottle manager)
         """
+        return self.update_config_bulk(config, {key: value}, scope, remove, fallback)
+
+    def update_config_bulk(
+            self,
+            config: BottleConfig,
+            updates: dict,
+            scope: str = "",
+            remove: bool = False,
+            fallback: bool = False
+    ) -> Result[dict]:
+        """
+        Same as update_config, but for many keys at once, writing the
+        config file only one time.
+        """
+        if not updates:
+            return Result(status=True, data={"config": config})
+
         _name = config.Name
-        logging.info(f"Setting Key {key}={value} for bottle {_name}…")
+        for key, value in updates.items():
+            logging.info(f"Setting Key {key}={value} for bottle {_name}…")
 
         _config = config.copy()
         wineboot = WineBoot(_config)
         wineserver = WineServer(_config)
         bottle_path = ManagerUtils.get_bottle_path(config)
 
-        if key == "sync":
+        if "sync" in updates:
             '''
             Workaround <https://github.com/bottlesdevs/Bottles/issues/916>
             Sync type change requires wineserver restart or wine will fail
@@ -891,20 +909,21 @@ class Manager:
             wineboot.kill()
             wineserver.wait()
 
-        if scope:
-            if remove:
-                del config[scope][key]
-            elif config[scope].get(key) and fallback:
-                config[scope][f"{key}-{uuid.uuid4()}"] = value
-            else:
-                config[scope][key] = value
-        else:
-            if remove:
-                del config[key]
-            elif config.get(key) and fallback:
-                config[f"{key}-{uuid.uuid4()}"] = value
+        for key, value in updates.items():
+            if scope:
+                if remove:
+                    del config[scope][key]
+                elif config[scope].get(key) and fallback:
+                    config[scope][f"{key}-{uuid.uuid4()}"] = value
+                else:
+                    config[scope][key] = value
             else:
-                config[key] = value
+                if remove:
+                    del config[key]
+                elif config.get(key) and fallback:
+                    config[f"{key}-{uuid.uuid4()}"] = value
+                else:
+                    config[key] = value
 
         config.dump(os.path.join(bottle_path, "bottle.yml"))
 
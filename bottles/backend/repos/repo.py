@@ -23,6 +23,7 @@ from threading import Lock as PyLock
 from typing import Dict
 
 from bottles.backend.logger import Logger
+from bottles.backend.utils.curl import new_curl
 
 from bottles.frontend.utils.threading import RunAsync
 
@@ -35,6 +36,7 @@ class Repo:
     def __init__(self, url: str, index: str, offline: bool = False, callback = None):
         self.url = url
         self.catalog = None
+        self.__manifests = {}
 
         def set_catalog(result, error=None):
             self.catalog = result
@@ -51,9 +53,7 @@ class Repo:
         try:
             buffer = BytesIO()
 
-            c = pycurl.Curl()
-            c.setopt(c.URL, index)
-            c.setopt(c.FOLLOWLOCATION, True)
+            c = new_curl(index)
             c.setopt(c.WRITEDATA, buffer)
             c.perform()
             c.close()
@@ -67,26 +67,73 @@ class Repo:
             return {}
 
     def get_manifest(self, url: str, plain: bool = False):
+        """
+        Fetch a manifest from the repository. Fetched manifests are kept
+        together with their ETag/Last-Modified validators, so following
+        requests for the same url are conditional and a 304 response
+        reuses the cached copy instead of downloading and parsing it again.
+        """
+        cached = self.__manifests.get(url)
+
         try:
             buffer = BytesIO()
+            headers = {}
 
-            c = pycurl.Curl()
-            c.setopt(c.URL, url)
-            c.setopt(c.FOLLOWLOCATION, True)
+            c = new_curl(url)
             c.setopt(c.WRITEDATA, buffer)
+            c.setopt(c.HEADERFUNCTION, lambda line: self.__parse_header(line, headers))
+            if cached:
+                c.setopt(c.HTTPHEADER, cached["validators"])
             c.perform()
+            code = c.getinfo(c.RESPONSE_CODE)
             c.close()
-            
-            res = buffer.getvalue()
+
+            if cached and code == 304:
+                logging.debug(f"Manifest {url} not modified, using cached copy")
+            else:
+                cached = {
+                    "validators": self.__get_validators(headers),
+                    "raw": buffer.getvalue(),
+                    "parsed": None
+                }
+                # never cache error pages, nor keep stale validators
+                if code == 200 and cached["validators"]:
+                    self.__manifests[url] = cached
+                elif code == 200:
+                    self.__manifests.pop(url, None)
 
             if plain:
-                return res.decode("utf-8")
+                return cached["raw"].decode("utf-8")
 
-            return yaml.load(res)
+            if cached["parsed"] is None:
+                cached["parsed"] = yaml.load(cached["raw"])
+
+            return cached["parsed"]
         except (pycurl.error, yaml.YAMLError):
             logging.error(f"Cannot fetch {self.name} manifest.")
             return {}
 
+    @staticmethod
+    def __parse_header(line: bytes, headers: dict):
+        line = line.decode("iso-8859-1")
+        if line.startswith("HTTP/"):
+            # a new response begins (e.g. after a redirect)
+            headers.clear()
+            return
+        if ":" not in line:
+            return
+        key, value = line.split(":", 1)
+        headers[key.strip().lower()] = value.strip()
+
+    @staticmethod
+    def __get_validators(headers: dict) -> list:
+        validators = []
+        if headers.get("etag"):
+            validators.append(f"If-None-Match: {headers['etag']}")
+        if headers.get("last-modified"):
+            validators.append(f"If-Modified-Since: {headers['last-modified']}")
+        return validators
+
 class RepoStatus:
     LOCKS: Dict[str, PyLock] = {}
 
@@ -0,0 +1,39 @@
+# curl.py
+#
+# Copyright 2022 brombinmirko <send@mirko.pm>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, in version 3 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import pycurl
+
+# handles are used from several threads at once, so only the DNS cache and
+# TLS sessions are shared: libcurl can't share a connection cache that way
+_share = pycurl.CurlShare()
+_share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+_share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+
+
+def new_curl(url: str) -> pycurl.Curl:
+    """
+    Return a Curl handle for the given url, following redirects. All the
+    handles created here share the DNS cache and TLS sessions, so
+    consecutive requests to the same host (e.g. manifests, icons and
+    installer steps) skip the DNS lookup and resume the TLS session
+    instead of doing a full handshake.
+    """
+    c = pycurl.Curl()
+    c.setopt(c.SHARE, _share)
+    c.setopt(c.URL, url)
+    c.setopt(c.FOLLOWLOCATION, True)
+    return c
@@ -19,10 +19,10 @@ import shutil
 import gi
 import os
 import locale
+import time
 import icoextract
 from glob import glob
 from typing import NewType, Union
-from datetime import datetime
 from gi.repository import Gdk, Gio, GLib, Gtk
 from gettext import gettext as _
 
@@ -223,39 +223,35 @@ class ManagerUtils:
             icon = custom_icon
 
         if not use_xdp:
-            file_name_template = "%s/%s--%s--%s.desktop"
-            existing_files = glob(file_name_template % (
-                Paths.applications,
-                config.Name,
-                program.get("name"),
-                "*"
-            ))
-            desktop_file = file_name_template % (
-                Paths.applications,
-                config.Name,
-                program.get("name"),
-                datetime.now().timestamp()
-            )
+            file_name_prefix = f"{Paths.applications}/{config.Name}--{program.get('name')}"
+            existing_files = glob(f"{file_name_prefix}--*.desktop")
+            desktop_file = f"{file_name_prefix}--{time.time_ns()}.desktop"
 
             if existing_files:
                 for file in existing_files:
                     os.remove(file)
 
-            with open(desktop_file, "w") as f:
-                f.write(f"[Desktop Entry]\n")
-                f.write(f"Name={program.get('name')}\n")
-                f.write(f"Exec={cmd_cli} run -p {shlex.quote(program.get('name'))} -b '{config.get('Name')}' -- %u\n")
-                f.write(f"Type=Application\n")
-                f.write(f"Terminal=false\n")
-                f.write(f"Categories=Application;\n")
-                f.write(f"Icon={icon}\n")
-                f.write(f"Comment=Launch {program.get('name')} using Bottles.\n")
-                f.write(f"StartupWMClass={program.get('name')}\n")
+            lines = [
+                "[Desktop Entry]",
+                f"Name={program.get('name')}",
+                f"Exec={cmd_cli} run -p {shlex.quote(program.get('name'))} -b '{config.get('Name')}' -- %u",
+                "Type=Application",
+                "Terminal=false",
+                "Categories=Application;",
+                f"Icon={icon}",
+                f"Comment=Launch {program.get('name')} using Bottles.",
+                f"StartupWMClass={program.get('name')}",
                 # Actions
-                f.write("Actions=Configure;\n")
-                f.write("[Desktop Action Configure]\n")
-                f.write("Name=Configure in Bottles\n")
-                f.write(f"Exec={cmd_legacy} -b '{config.get('Name')}'\n")
+                "Actions=Configure;",
+                "[Desktop Action Configure]",
+                "Name=Configure in Bottles",
+                f"Exec={cmd_legacy} -b '{config.get('Name')}'",
+            ]
+
+            # write to a sibling first, so the entry never appears half-written
+            with open(f"{desktop_file}.tmp", "w") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(f"{desktop_file}.tmp", desktop_file)
 
             return True
 